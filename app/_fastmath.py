@@ -0,0 +1,70 @@
+"""
+Numba-compiled scalar kernels for the hot comparison math.
+
+The per-pair distance/color checks in Circle and Rectangle are called once
+for every (existing object, new detection) pair on every frame. Doing that
+math through tiny NumPy arrays pays array-allocation and ufunc-dispatch cost
+for a handful of scalar operations, so the kernels here work on plain
+ints/floats and are compiled with Numba (cached on disk, so the JIT warmup
+is paid only once per machine).
+"""
+
+import math
+
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def circles_same(
+    x1: int, y1: int, r1: int, x2: int, y2: int, r2: int, dist_thr: int, rad_thr: int
+) -> float:
+    """
+    Compares two circles by center distance and radius difference.
+
+    The squared distance is compared against the squared threshold first,
+    so the square root is only computed on the accept path.
+
+    Args:
+        x1, y1, r1: Center and radius of the first circle.
+        x2, y2, r2: Center and radius of the second circle.
+        dist_thr (int): Maximum allowed distance between the centers.
+        rad_thr (int): Maximum allowed difference in radius.
+
+    Returns:
+        float: The distance between the centers if the circles match,
+               -1.0 otherwise.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    d2 = dx * dx + dy * dy
+    if d2 <= dist_thr * dist_thr and abs(r2 - r1) <= rad_thr:
+        return math.sqrt(d2)
+    return -1.0
+
+
+@njit(cache=True)
+def colors_similar(
+    r1: float,
+    g1: float,
+    b1: float,
+    r2: float,
+    g2: float,
+    b2: float,
+    tolerance: int,
+) -> bool:
+    """
+    Compares two RGB colors component-wise with a tolerance.
+
+    Args:
+        r1, g1, b1: Components of the first color (0-255).
+        r2, g2, b2: Components of the second color (0-255).
+        tolerance (int): Maximum allowed difference per component.
+
+    Returns:
+        bool: True if every component differs by at most `tolerance`.
+    """
+    return (
+        abs(r1 - r2) <= tolerance
+        and abs(g1 - g2) <= tolerance
+        and abs(b1 - b2) <= tolerance
+    )
@@ -0,0 +1,115 @@
+"""
+Numba-compiled match kernels over the tracker's structure-of-arrays pools.
+
+The tracker snapshots its tracked objects into parallel NumPy columns once
+per frame; these kernels then scan a candidate index list against those
+columns entirely outside the interpreter, so the per-candidate frame,
+distance, size, and color checks cost no Python dispatch at all. Colors of
+untracked validity are stored as NaN rows: circles treat an unknown color
+as a pass (matching Circle.same_circle, where an invalid color never vetoes
+a match) while rectangles treat it as a reject (matching
+Rectangle.same_rectangle).
+"""
+
+import math
+
+from numba import njit
+
+
+@njit(cache=True)
+def match_circle(
+    xs,
+    ys,
+    rs,
+    frames,
+    colors,
+    candidates,
+    x,
+    y,
+    r,
+    frame,
+    cr,
+    cg,
+    cb,
+    dist_thr,
+    rad_thr,
+    color_tol,
+    max_gap,
+):
+    """
+    Returns the first candidate circle index matching the query, or -1.
+
+    Candidates are expected sorted nearest-first, so the returned index is
+    the closest circle passing the frame-gap, distance, radius, and color
+    checks of Circle.same_circle.
+    """
+    for k in range(candidates.shape[0]):
+        i = candidates[k]
+        if frames[i] >= frame or frame - frames[i] > max_gap:
+            continue
+        dx = x - xs[i]
+        dy = y - ys[i]
+        if dx * dx + dy * dy > dist_thr * dist_thr:
+            continue
+        if abs(r - rs[i]) > rad_thr:
+            continue
+        if not (math.isnan(cr) or math.isnan(colors[i, 0])):
+            if (
+                abs(cr - colors[i, 0]) > color_tol
+                or abs(cg - colors[i, 1]) > color_tol
+                or abs(cb - colors[i, 2]) > color_tol
+            ):
+                continue
+        return i
+    return -1
+
+
+@njit(cache=True)
+def match_rectangle(
+    cxs,
+    cys,
+    ws,
+    hs,
+    frames,
+    colors,
+    candidates,
+    cx,
+    cy,
+    w,
+    h,
+    frame,
+    cr,
+    cg,
+    cb,
+    dist_thr,
+    size_thr,
+    color_tol,
+    max_gap,
+):
+    """
+    Returns the first candidate rectangle index matching the query, or -1.
+
+    Mirrors the checks of Rectangle.same_rectangle: frame gap, center
+    distance, width/height difference, and color similarity (rectangles
+    with an unknown color never match).
+    """
+    for k in range(candidates.shape[0]):
+        i = candidates[k]
+        if frames[i] >= frame or frame - frames[i] > max_gap:
+            continue
+        dx = cx - cxs[i]
+        dy = cy - cys[i]
+        if dx * dx + dy * dy > dist_thr * dist_thr:
+            continue
+        if abs(w - ws[i]) > size_thr or abs(h - hs[i]) > size_thr:
+            continue
+        if math.isnan(cr) or math.isnan(colors[i, 0]):
+            continue
+        if (
+            abs(cr - colors[i, 0]) > color_tol
+            or abs(cg - colors[i, 1]) > color_tol
+            or abs(cb - colors[i, 2]) > color_tol
+        ):
+            continue
+        return i
+    return -1
@@ -7,13 +7,114 @@ optionally tracks the circle across multiple frames (data list).
 """
 
 import os
-import math
 import json
 import numpy as np
+from collections import namedtuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from app._fastmath import circles_same, colors_similar
 from app.logging_config import logger
 
 
+def dump_json(data: dict | list, path: str) -> None:
+    """
+    Writes data to a JSON file, using orjson when it is available.
+
+    orjson serializes in C several times faster than the stdlib `json`
+    module; environments without it fall back to `json.dump`.
+
+    Args:
+        data (dict | list): The data to serialize.
+        path (str): Path of the JSON file to write.
+    """
+    if orjson is not None:
+        with open(path, "wb") as file:
+            file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4)
+
+
+_DATA_DIR_READY = False
+
+
+def ensure_data_dir() -> None:
+    """
+    Creates the output "data" directory if needed, at most once per process.
+
+    Saving hundreds of tracks used to stat the directory on every call;
+    after the first successful check the syscall is skipped entirely.
+    """
+    global _DATA_DIR_READY
+    if not _DATA_DIR_READY:
+        os.makedirs("data", exist_ok=True)
+        _DATA_DIR_READY = True
+
+
+# One tracked observation of a circle. Building a dict with string keys for
+# every matched frame is deferred to save time; the hot matching path only
+# appends one tuple per frame.
+CircleFrame = namedtuple(
+    "CircleFrame", ["x", "y", "frame", "radius", "color", "distance"], defaults=(None,)
+)
+
+
+def is_valid_color(color: tuple | None) -> bool:
+    """
+    Validates if a color is a valid RGB tuple.
+
+    The checks are unrolled so invalid inputs short-circuit without paying
+    for an `all()` generator over three elements.
+
+    Args:
+        color (Tuple[float, float, float]): The RGB color tuple to validate.
+
+    Returns:
+        bool: True if valid, False otherwise.
+    """
+    return (
+        isinstance(color, tuple)
+        and len(color) == 3
+        and isinstance(color[0], float)
+        and 0.0 <= color[0] <= 255.0
+        and isinstance(color[1], float)
+        and 0.0 <= color[1] <= 255.0
+        and isinstance(color[2], float)
+        and 0.0 <= color[2] <= 255.0
+    )
+
+
+def are_colors_similar(
+    color1: tuple | None,
+    color2: tuple | None,
+    tolerance: int = 30,
+) -> bool | None:
+    """
+    Compares the similarity of two RGB colors with a specified tolerance.
+
+    Args:
+        color1 (Tuple[float, float, float]): The first RGB color as a tuple (R, G, B) with values ranging from 0 to 255.
+        color2 (Tuple[float, float, float]): The second RGB color as a tuple (R, G, B) with values ranging from 0 to 255.
+        tolerance (int, optional): The maximum allowed difference for each color component (R, G, B). Defaults to 30.
+
+    Returns:
+        Optional[bool]: True if the colors are considered similar within the specified tolerance, False otherwise.
+                        None if either color1 or color2 is invalid.
+    """
+    if color1 is None or color2 is None:
+        return None
+    if not (is_valid_color(color1) and is_valid_color(color2)):
+        return None
+
+    return colors_similar(
+        color1[0], color1[1], color1[2], color2[0], color2[1], color2[2], tolerance
+    )
+
+
 class Circle:
     """
     Represents a circle object with properties and methods for managing its data.
@@ -24,15 +125,17 @@ class Circle:
         radius (int): Radius of the circle.
         color (tuple): Color of the circle (represented as a tuple of floats, likely RGB values).
         frame (int): Frame number associated with the circle data.
-        data (list): A list of dictionaries containing information about the circle at different frames (includes x, y, frame, radius, color, and distance).
+        data (list): A list of CircleFrame tuples containing information about the circle at different frames (includes x, y, frame, radius, color, and distance).
     """
 
+    __slots__ = ("x", "y", "y_display", "frame", "radius", "color", "data", "_color_arr")
+
     def __init__(
         self,
         x: int = 0,
         y: int = 0,
         radius: int = 0,
-        color: tuple = None,
+        color: tuple | None = None,
         frame: int = 0,
         video_height: int = 0,
     ):
@@ -49,21 +152,25 @@ class Circle:
         """
         self.x = int(x)
         self.y = int(y)
+        self.y_display = video_height - self.y
         self.frame = int(frame)
         self.radius = int(radius)
         self.color = Circle.filter_nan(color)
-        self.data = [
-            {
-                "x": self.x,
-                "y": (video_height - self.y),
-                "frame": frame,
-                "radius": self.radius,
-                "color": self.color,
-            }
+        self._color_arr = (
+            None if self.color is None else np.asarray(self.color, dtype=np.float32)
+        )
+        self.data: list = [
+            CircleFrame(
+                x=self.x,
+                y=self.y_display,
+                frame=frame,
+                radius=self.radius,
+                color=self.color,
+            )
         ]
 
     @staticmethod
-    def filter_nan(color: tuple) -> tuple:
+    def filter_nan(color: tuple | None) -> tuple | None:
         """
         Filters out NaN values and keeps only valid floating-point numbers.
 
@@ -74,54 +181,88 @@ class Circle:
             Optional[List[float]]: A new list containing only the valid floating-point numbers from the input,
                                    or None if all values are NaN.
         """
-        filtered_color = []
-        for x in color:
-            if not isinstance(x, float) or math.isnan(x):
-                return None
-            filtered_color.append(x)
+        try:
+            arr = np.asarray(color)
+        except (TypeError, ValueError):
+            return None
 
-        return tuple(filtered_color)
+        if arr.dtype != np.float64 or np.isnan(arr).any():
+            return None
+        return tuple(arr.tolist())
 
+    # The implementations live at module level so callers on the hot path can
+    # skip the class attribute lookup; these staticmethods are kept for the
+    # established Circle.is_valid_color / Circle.are_colors_similar API.
     @staticmethod
-    def is_valid_color(color: tuple[float, float, float]) -> bool:
-        """
-        Validates if a color is a valid RGB tuple.
-
-        Args:
-            color (Tuple[float, float, float]): The RGB color tuple to validate.
-
-        Returns:
-            bool: True if valid, False otherwise.
-        """
-        return (
-            isinstance(color, tuple)
-            and len(color) == 3
-            and all(isinstance(c, float) and 0 <= c <= 255 for c in color)
-        )
+    def is_valid_color(color: tuple | None) -> bool:
+        """Validates if a color is a valid RGB tuple. See `is_valid_color`."""
+        return is_valid_color(color)
 
     @staticmethod
     def are_colors_similar(
-        color1: tuple[float, float, float],
-        color2: tuple[float, float, float],
+        color1: tuple | None,
+        color2: tuple | None,
         tolerance: int = 30,
-    ) -> bool:
+    ) -> bool | None:
+        """Compares two RGB colors with a tolerance. See `are_colors_similar`."""
+        return are_colors_similar(color1, color2, tolerance)
+
+    @classmethod
+    def match_batch(
+        cls,
+        prev_xyr,
+        new_xyr,
+        prev_rgb,
+        new_rgb,
+        distance_threshold: int = 50,
+        radius_threshold: int = 17,
+        color_tolerance: int = 30,
+    ) -> np.ndarray:
         """
-        Compares the similarity of two RGB colors with a specified tolerance.
+        Matches a batch of new detections against previous circles at once.
+
+        Instead of entering Python for every (previous, new) pair, the pairwise
+        squared distances, radius differences, and color differences are
+        computed with a single NumPy broadcast over the whole batch.
 
         Args:
-            color1 (Tuple[float, float, float]): The first RGB color as a tuple (R, G, B) with values ranging from 0 to 255.
-            color2 (Tuple[float, float, float]): The second RGB color as a tuple (R, G, B) with values ranging from 0 to 255.
-            tolerance (int, optional): The maximum allowed difference for each color component (R, G, B). Defaults to 30.
+            prev_xyr (array-like): (N, 3) array of (x, y, radius) for previous circles.
+            new_xyr (array-like): (M, 3) array of (x, y, radius) for new detections.
+            prev_rgb (array-like): (N, 3) array of RGB colors for previous circles.
+            new_rgb (array-like): (M, 3) array of RGB colors for new detections.
+            distance_threshold (int, optional): Maximum center distance. Defaults to 50.
+            radius_threshold (int, optional): Maximum radius difference. Defaults to 17.
+            color_tolerance (int, optional): Maximum per-component color difference. Defaults to 30.
 
         Returns:
-            Optional[bool]: True if the colors are considered similar within the specified tolerance, False otherwise.
-                            None if either color1 or color2 is invalid.
+            np.ndarray: Length-M array with the index of the nearest matching
+                        previous circle for each detection, or -1 if none match.
         """
-        if not (Circle.is_valid_color(color1) and Circle.is_valid_color(color2)):
-            return None
+        prev = np.asarray(prev_xyr, dtype=np.int64).reshape(-1, 3)
+        new = np.asarray(new_xyr, dtype=np.int64).reshape(-1, 3)
+        prev_colors = np.asarray(prev_rgb, dtype=np.float64).reshape(-1, 3)
+        new_colors = np.asarray(new_rgb, dtype=np.float64).reshape(-1, 3)
+
+        if prev.shape[0] == 0 or new.shape[0] == 0:
+            return np.full(new.shape[0], -1, dtype=np.int64)
+
+        d2 = (prev[:, None, 0] - new[None, :, 0]) ** 2 + (
+            prev[:, None, 1] - new[None, :, 1]
+        ) ** 2
+        radius_diff = np.abs(prev[:, None, 2] - new[None, :, 2])
+        color_diff = np.max(
+            np.abs(prev_colors[:, None, :] - new_colors[None, :, :]), axis=2
+        )
+
+        mask = (
+            (d2 <= distance_threshold * distance_threshold)
+            & (radius_diff <= radius_threshold)
+            & (color_diff <= color_tolerance)
+        )
 
-        color_diffs = np.abs(np.array(color1) - np.array(color2))
-        return np.all(color_diffs <= tolerance)
+        best = np.argmin(np.where(mask, d2, np.inf), axis=0)
+        best[~mask[best, np.arange(new.shape[0])]] = -1
+        return best
 
     def are_circles_same(
         self, circle: "Circle", distance_threshold: int = 50, radius_threshold: int = 17
@@ -139,10 +280,18 @@ class Circle:
         Returns:
             Union[float, bool]: The distance between the circles if they are considered the same, False otherwise.
         """
-        distance = np.sqrt((circle.x - self.x) ** 2 + (circle.y - self.y) ** 2)
-        radius_diff = abs(circle.radius - self.radius)
+        distance = circles_same(
+            self.x,
+            self.y,
+            self.radius,
+            circle.x,
+            circle.y,
+            circle.radius,
+            distance_threshold,
+            radius_threshold,
+        )
 
-        if distance <= distance_threshold and radius_diff <= radius_threshold:
+        if distance >= 0.0:
             return distance
         return False
 
@@ -167,23 +316,77 @@ class Circle:
         if distance is False:
             return False
 
-        if Circle.are_colors_similar(self.color, circle.color) is False:
+        if are_colors_similar(self.color, circle.color) is False:
             return False
 
         self.x, self.y, self.frame = circle.x, circle.y, circle.frame
+        self.y_display = circle.y_display
         self.data.append(
-            {
-                "x": circle.x,
-                "y": (video_height - circle.y),
-                "frame": circle.frame,
-                "radius": circle.radius,
-                "distance": distance,
-                "color": circle.color,
-            }
+            CircleFrame(
+                x=circle.x,
+                y=circle.y_display,
+                frame=circle.frame,
+                radius=circle.radius,
+                color=circle.color,
+                distance=distance,
+            )
         )
 
         return True
 
+    def serialize_data(self) -> list:
+        """
+        Converts the tracked frame tuples to JSON-ready dictionaries.
+
+        The `distance` field is omitted for observations that have none
+        (the first observation of a track), matching the saved file layout.
+
+        Returns:
+            list: One dictionary per tracked frame.
+        """
+        return [
+            {
+                key: value
+                for key, value in point._asdict().items()
+                if key != "distance" or value is not None
+            }
+            for point in self.data
+        ]
+
+    def to_dict(self) -> dict:
+        """
+        Returns the JSON-ready representation of this track.
+
+        Returns:
+            dict: The track's properties and serialized frame data.
+        """
+        return {
+            "radius": self.radius,
+            "color": self.color,
+            "data": self.serialize_data(),
+        }
+
+    @classmethod
+    def save_all(cls, objects: list, path: str = "data/circle_data.json") -> None:
+        """
+        Saves all given tracks into a single JSON array file.
+
+        Writing one file per track costs an open/write/close cycle per
+        object; a batched export pays the filesystem metadata overhead once.
+
+        Args:
+            objects (list): The tracked objects to save.
+            path (str, optional): Path of the batched JSON file. Defaults to "data/circle_data.json".
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            dump_json([obj.to_dict() for obj in objects], path)
+            logger.info("Saved data for %s objects in: %s", len(objects), path)
+        except Exception as e:
+            logger.error("Failed to save batched data: %s", e)
+
     def save_circle(self, name: int = 0) -> None:
         """
         Saves the circle's data as a JSON file.
@@ -197,14 +400,13 @@ class Circle:
             "filename": filename,
             "radius": self.radius,
             "color": self.color,
-            "data": self.data,
+            "data": self.serialize_data(),
         }
 
         try:
-            os.makedirs("data", exist_ok=True)
+            ensure_data_dir()
             data_file = os.path.join("data", filename)
-            with open(data_file, "w", encoding="utf-8") as file:
-                json.dump(circle_data, file, indent=4)
+            dump_json(circle_data, data_file)
             logger.info("Saved data for circle in: %s", filename)
         except Exception as e:
             logger.error("Failed to save circle data: %s", e)
@@ -212,6 +414,10 @@ class Circle:
 
 # Example usage of the Circle class
 if __name__ == "__main__":
+    from app.logging_config import configure_logging
+
+    configure_logging()
+
     # Initialize a circle
     circle1 = Circle(
         x=100, y=200, radius=50, color=(255.0, 0.0, 0.0), frame=1, video_height=1080
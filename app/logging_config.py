@@ -2,21 +2,31 @@
 
 import logging
 
+# Importing the app modules attaches only a NullHandler: no logfile is
+# opened and no handler is bolted onto the root logger as an import side
+# effect. Entry points opt into real output via configure_logging().
+logger = logging.getLogger("app")
+logger.addHandler(logging.NullHandler())
 
-def setup_logging():
-    logger = logging.getLogger(__name__)
-    logging.basicConfig(
-        filename="logfile.log",
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-    )
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
+
+def configure_logging(path: str = "logfile.log") -> None:
+    """
+    Attaches the file and console handlers to the application logger.
+
+    Call this from an application entry point (the __main__ blocks); library
+    users and tests keep the silent NullHandler default.
+
+    Args:
+        path (str, optional): Path of the log file. Defaults to "logfile.log".
+    """
     formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    console_handler.setFormatter(formatter)
-    logging.getLogger().addHandler(console_handler)
 
-    return logger
+    file_handler = logging.FileHandler(path)
+    file_handler.setFormatter(formatter)
 
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
 
-logger = setup_logging()
+    logger.setLevel(logging.INFO)
+    logger.addHandler(file_handler)
+    logger.addHandler(console_handler)
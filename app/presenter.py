@@ -9,25 +9,22 @@ It offers functionalities to:
 The Presenter class manages the data and animation process, ensuring a smooth and informative presentation of the trajectory data.
 """
 
-"""
-This script provides a Presenter class for loading, preparing, and visualizing trajectory data from JSON files.
-
-It offers functionalities to:
-    - Load JSON data from multiple files selected by the user
-    - Process and prepare the data for animation
-    - Create and display an animated visualization of object trajectories
-
-The Presenter class manages the data and animation process, ensuring a smooth and informative presentation of the trajectory data.
-"""
-
+import os
 import sys
 import json
-from tkinter import Tk, filedialog
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from app.logging_config import logger
 
+# tkinter and matplotlib are imported lazily inside the methods that need
+# them: both cost hundreds of milliseconds and tens of MB at import time,
+# which nothing importing this module for the data-handling API should pay.
+
 
 class Presenter:
     """
@@ -61,6 +58,9 @@ class Presenter:
         self.max_frame = 0
         self.max_x = 0
         self.max_y = 0
+        self.ax = None
+        self.title = None
+        self.lines = []
 
     def load_json_files(self):
         """
@@ -80,6 +80,8 @@ class Presenter:
 
         If no files are selected or errors occur during loading, returns None.
         """
+        from tkinter import Tk, filedialog
+
         all_data = []
         file_names = []
 
@@ -88,7 +90,7 @@ class Presenter:
 
         file_paths = filedialog.askopenfilenames(
             title="Select JSON data file(s) from tracker.py - circle_data_[number].py or rectangle_data_[number].py ",
-            filetypes=[("JSON files", "*.json")],
+            filetypes=[("JSON files", "*.json"), ("JSON Lines files", "*.jsonl")],
         )
 
         if not file_paths:
@@ -97,15 +99,41 @@ class Presenter:
 
         for file_path in file_paths:
             try:
-                with open(file_path, "r", encoding="utf-8") as file:
-                    file_data = json.load(file)["data"]
-                    file_names.append(file_path.split("/")[-1])
-                    all_data.append(file_data)
+                with open(file_path, "rb") as file:
+                    base_name = os.path.basename(file_path)
+                    if file_path.endswith(".jsonl"):
+                        # Streamed export (tracker spill sink): one JSON
+                        # object per line, one line per track.
+                        for index, line in enumerate(file):
+                            if not line.strip():
+                                continue
+                            if orjson is not None:
+                                track = orjson.loads(line)
+                            else:
+                                track = json.loads(line)
+                            file_names.append(f"{base_name}[{index}]")
+                            all_data.append(track["data"])
+                        logger.info("File '%s' successfully loaded.", file_path)
+                        continue
+
+                    if orjson is not None:
+                        parsed = orjson.loads(file.read())
+                    else:
+                        parsed = json.load(file)
+
+                    if isinstance(parsed, list):
+                        # Batched export (Circle.save_all): one array of tracks.
+                        for index, track in enumerate(parsed):
+                            file_names.append(f"{base_name}[{index}]")
+                            all_data.append(track["data"])
+                    else:
+                        file_names.append(base_name)
+                        all_data.append(parsed["data"])
                     logger.info("File '%s' successfully loaded.", file_path)
             except FileNotFoundError:
                 logger.error("File '%s' not found.", file_path)
                 continue
-            except json.JSONDecodeError:
+            except ValueError:
                 logger.error("File '%s' is not a valid JSON file.", file_path)
                 continue
             except Exception as e:
@@ -118,81 +146,45 @@ class Presenter:
         """
         Updates the animation with the filtered data for the specified frame.
 
-        This function iterates through multiple datasets (assumed to be stored in
-        self.x_coords_list, self.y_coords_list, and self.filenames) and updates the plot
-        with filtered data points up to the given frame number.
+        The axes, grid, legend, and one Line2D artist per track are created
+        once in `present`; this function only pushes the coordinates up to
+        the given frame into the cached artists with `set_data` and refreshes
+        the title, so blitting can redraw just the changed artists instead of
+        re-rendering the whole figure.
 
-        This function clears the current plot and re-draws the trajectories of objects up to the specified frame. It updates the plot with the following settings:
-        - Draws trajectories for each object using the x and y coordinates.
-        - Only includes points where coordinates are not equal to -1.
-        - Labels each trajectory with the filename it came from.
-        - Sets the aspect ratio to be equal for both axes.
-        - Sets the x and y axis limits to predefined maximum values.
-        - Adds grid lines to both axes with a specified style and interval.
-        - Adds a legend to the plot.
+        Points where either coordinate equals -1 (gap markers) are filtered
+        out with a vectorized mask.
 
         Args:
-            frame (int): : The current frame number in the animation.
+            frame (int): The current frame number in the animation.
 
         Attributes used:
         - self.x_coords_list (list): List of x-coordinates for each object.
         - self.y_coords_list (list): List of y-coordinates for each object.
-        - self.filenames (list): List of filenames corresponding to each object.
+        - self.lines (list): Cached Line2D artists, one per track.
+        - self.title (Text): Cached title artist.
         - self.min_frame (int): The minimum frame number to display.
-        - self.max_x (float): The maximum value for the x-axis.
-        - self.max_y (float): The maximum value for the y-axis
 
         Returns:
-            None
+            list: The updated artists, as required by blitting.
         """
-        plt.cla()
-        for x_coords, y_coords, filename in zip(
-            self.x_coords_list, self.y_coords_list, self.filenames
+        for line, x_coords, y_coords in zip(
+            self.lines, self.x_coords_list, self.y_coords_list
         ):
-            filtered_points = [
-                (x, y)
-                for x, y in zip(x_coords[: frame + 1], y_coords[: frame + 1])
-                if x != -1 and y != -1
-            ]
+            xs = np.asarray(x_coords[: frame + 1])
+            ys = np.asarray(y_coords[: frame + 1])
+            mask = (xs != -1) & (ys != -1)
+            line.set_data(xs[mask], ys[mask])
 
-            if filtered_points:
-                filtered_x, filtered_y = zip(*filtered_points)
-                plt.plot(
-                    filtered_x,
-                    filtered_y,
-                    marker="o",
-                    label=filename,
-                )
-        plt.xlabel("X Position")
-        plt.ylabel("Y Position")
-        plt.title(f"Object Path (Frame {frame+self.min_frame-1}) On Enter close.")
-        plt.gca().set_aspect("equal", adjustable="box")
-        plt.xlim(0, max(500, self.max_x))
-        plt.ylim(0, max(500, self.max_y))
-        plt.legend()
-        plt.grid(
-            True,
-            which="both",
-            linestyle="--",
-            linewidth=0.5,
-            color="gray",
-            axis="x",
-            alpha=0.7,
-            markevery=20,
-        )
-        plt.grid(
-            True,
-            which="both",
-            linestyle="--",
-            linewidth=0.5,
-            color="gray",
-            axis="y",
-            alpha=0.7,
-            markevery=20,
+        self.title.set_text(
+            f"Object Path (Frame {frame+self.min_frame-1}) On Enter close."
         )
+        return self.lines + [self.title]
 
     def on_key_press(self, event):
         """Handles key press events to close the animation on Enter key."""
+        import matplotlib.pyplot as plt
+
         if event.key == "enter":
             logger.info("End of presentation")
             plt.close(event.canvas.figure)
@@ -244,6 +236,9 @@ class Presenter:
 
         The animation is displayed using matplotlib's FuncAnimation and is shown in a window.
         """
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+
         data_list, self.filenames = self.load_json_files()
 
         if data_list:
@@ -252,52 +247,83 @@ class Presenter:
             frames_list = []
 
             for data in data_list:
-                x_coords = [point["x"] for point in data]
-                y_coords = [point["y"] for point in data]
-                frames = [point["frame"] for point in data]
+                x_coords = np.fromiter(
+                    (point["x"] for point in data), dtype=np.int32, count=len(data)
+                )
+                y_coords = np.fromiter(
+                    (point["y"] for point in data), dtype=np.int32, count=len(data)
+                )
+                frames = np.fromiter(
+                    (point["frame"] for point in data), dtype=np.int32, count=len(data)
+                )
                 x_coords_list.append(x_coords)
                 y_coords_list.append(y_coords)
                 frames_list.append(frames)
 
-            flat_list = [item for sublist in frames_list for item in sublist]
-            self.min_frame = min(flat_list)
-            self.max_frame = max(flat_list)
-            flat_list = [item for sublist in x_coords_list for item in sublist]
-            self.max_x = max(flat_list)
-            flat_list = [item for sublist in y_coords_list for item in sublist]
-            self.max_y = max(flat_list)
-
-            full_data_list = []
-            for data in data_list:
-                new_dict = {i: (-1, -1) for i in range(self.min_frame, self.max_frame)}
-                for point in data:
-                    new_dict[point["frame"]] = (point["x"], point["y"])
-                full_data_list.append(new_dict)
-
-            for data in full_data_list:
-                x_coords = [data[x][0] for x in data if data[x] is not None]
-                y_coords = [data[x][1] for x in data if data[x] is not None]
-                frames = [x for x in data]
-
-                self.x_coords_list.append(x_coords)
-                self.y_coords_list.append(y_coords)
-                self.frames_list.append(frames)
+            self.min_frame = int(min(frames.min() for frames in frames_list))
+            self.max_frame = int(max(frames.max() for frames in frames_list))
+            self.max_x = int(max(x_coords.max() for x_coords in x_coords_list))
+            self.max_y = int(max(y_coords.max() for y_coords in y_coords_list))
+
+            span = self.max_frame - self.min_frame + 1
+            for x_coords, y_coords, frames in zip(
+                x_coords_list, y_coords_list, frames_list
+            ):
+                full_x = np.full(span, -1, dtype=np.int32)
+                full_y = np.full(span, -1, dtype=np.int32)
+                indices = frames - self.min_frame
+                full_x[indices] = x_coords
+                full_y[indices] = y_coords
+
+                self.x_coords_list.append(full_x)
+                self.y_coords_list.append(full_y)
+                self.frames_list.append(
+                    np.arange(self.min_frame, self.max_frame + 1, dtype=np.int32)
+                )
 
             fig = plt.figure(
                 figsize=(max(8, self.max_y / 100), max(6, self.max_x / 100))
             )
 
+            self.ax = fig.add_subplot(111)
+            self.ax.set_xlabel("X Position")
+            self.ax.set_ylabel("Y Position")
+            self.ax.set_aspect("equal", adjustable="box")
+            self.ax.set_xlim(0, max(500, self.max_x))
+            self.ax.set_ylim(0, max(500, self.max_y))
+            self.ax.grid(
+                True,
+                which="both",
+                linestyle="--",
+                linewidth=0.5,
+                color="gray",
+                alpha=0.7,
+            )
+            self.title = self.ax.set_title("")
+            self.lines = [
+                self.ax.plot([], [], marker="o", label=filename)[0]
+                for filename in self.filenames
+            ]
+            self.ax.legend()
+
             ani = animation.FuncAnimation(
-                fig, self.update, frames=max(map(len, self.frames_list)), interval=10
+                fig,
+                self.update,
+                frames=max(map(len, self.frames_list)),
+                interval=10,
+                blit=True,
+                cache_frame_data=False,
             )
 
             # Connect the key press event to the on_key_press function
             fig.canvas.mpl_connect("key_press_event", self.on_key_press)
 
-            plt.grid(True)
             plt.show()
 
 
 if __name__ == "__main__":
+    from app.logging_config import configure_logging
+
+    configure_logging()
     presenter = Presenter()
     presenter.present()
@@ -3,11 +3,20 @@
 """
 
 import os
-import json
+import math
 import numpy as np
 
-from app.circle import Circle
+from app.circle import Circle, are_colors_similar, dump_json, ensure_data_dir
 from app.logging_config import logger
+from collections import namedtuple
+
+
+# One tracked observation of a rectangle; see CircleFrame in app.circle.
+RectangleFrame = namedtuple(
+    "RectangleFrame",
+    ["x", "y", "frame", "width", "height", "color", "distance"],
+    defaults=(None,),
+)
 
 
 class Rectangle(Circle):
@@ -21,16 +30,18 @@ class Rectangle(Circle):
         height (int): The height of the rectangle.
         color (tuple): The color of the rectangle in RGB format.
         frame (int): Frame number associated with the rectangle data.
-        data (list): A list of dictionaries containing information about the rectangle at different frames (includes x, y, frame, width, height, color, and distance).
+        data (list): A list of RectangleFrame tuples containing information about the rectangle at different frames (includes x, y, frame, width, height, color, and distance).
     """
 
+    __slots__ = ("width", "height")
+
     def __init__(
         self,
         x: int = 0,
         y: int = 0,
         width: int = 0,
         height: int = 0,
-        color: tuple = None,
+        color: tuple | None = None,
         frame: int = 0,
         video_height=0,
     ):
@@ -47,19 +58,23 @@ class Rectangle(Circle):
         """
         self.x = int(x)
         self.y = int(y)
+        self.y_display = video_height - self.y
         self.width = int(width)
         self.height = int(height)
         self.frame = int(frame)
         self.color = self.filter_nan(color)
-        self.data = [
-            {
-                "x": self.x,
-                "y": (video_height - self.y),
-                "width": self.width,
-                "height": self.height,
-                "frame": frame,
-                "color": self.color,
-            }
+        self._color_arr = (
+            None if self.color is None else np.asarray(self.color, dtype=np.float32)
+        )
+        self.data: list = [
+            RectangleFrame(
+                x=self.x,
+                y=self.y_display,
+                frame=frame,
+                width=self.width,
+                height=self.height,
+                color=self.color,
+            )
         ]
 
     def are_rectangles_same(
@@ -82,18 +97,17 @@ class Rectangle(Circle):
         x1, y1, w1, h1 = (self.x, self.y, self.width, self.height)
         x2, y2, w2, h2 = (rect.x, rect.y, rect.width, rect.height)
 
-        center1 = (x1 + w1 // 2, y1 + h1 // 2)
-        center2 = (x2 + w2 // 2, y2 + h2 // 2)
+        dx = (x2 + w2 // 2) - (x1 + w1 // 2)
+        dy = (y2 + h2 // 2) - (y1 + h1 // 2)
 
-        distance = np.sqrt(
-            (center2[0] - center1[0]) ** 2 + (center2[1] - center1[1]) ** 2
-        )
-        size_diff = max(abs(w1 - w2), abs(h1 - h2))
-
-        if distance <= distance_threshold and size_diff <= size_diff_threshold:
-            return distance
-        else:
+        # All inputs are ints: compare squared distance against the squared
+        # threshold and only take the square root on the accept path.
+        distance_sq = dx * dx + dy * dy
+        if distance_sq > distance_threshold * distance_threshold:
+            return False
+        if max(abs(w1 - w2), abs(h1 - h2)) > size_diff_threshold:
             return False
+        return math.sqrt(distance_sq)
 
     def same_rectangle(self, rectangle: "Rectangle", video_height: int) -> bool:
         """Updates current rectangle's data if it matches with another rectangle.
@@ -116,7 +130,7 @@ class Rectangle(Circle):
         if distance is False:
             return False
 
-        if not Rectangle.are_colors_similar(self.color, rectangle.color):
+        if not are_colors_similar(self.color, rectangle.color):
             return False
 
         self.x, self.y, self.height, self.width, self.frame = (
@@ -126,19 +140,34 @@ class Rectangle(Circle):
             rectangle.height,
             rectangle.frame,
         )
+        self.y_display = rectangle.y_display
         self.data.append(
-            {
-                "x": rectangle.x,
-                "y": (video_height - rectangle.y),
-                "width": rectangle.width,
-                "height": rectangle.height,
-                "frame": rectangle.frame,
-                "distance": distance,
-                "color": self.color,
-            }
+            RectangleFrame(
+                x=rectangle.x,
+                y=rectangle.y_display,
+                frame=rectangle.frame,
+                width=rectangle.width,
+                height=rectangle.height,
+                color=self.color,
+                distance=distance,
+            )
         )
         return True
 
+    def to_dict(self) -> dict:
+        """
+        Returns the JSON-ready representation of this track.
+
+        Returns:
+            dict: The track's properties and serialized frame data.
+        """
+        return {
+            "width": self.width,
+            "height": self.height,
+            "color": self.color,
+            "data": self.serialize_data(),
+        }
+
     def save_rectangle(self, name: int = 0):
         """Saves the rectangle's data as a JSON file.
 
@@ -151,14 +180,13 @@ class Rectangle(Circle):
             "width": self.width,
             "height": self.height,
             "color": self.color,
-            "data": self.data,  # List of positions (dictionaries)
+            "data": self.serialize_data(),  # List of positions (dictionaries)
         }
 
         try:
-            os.makedirs("data", exist_ok=True)
+            ensure_data_dir()
             data_file = os.path.join("data", filename)
-            with open(data_file, "w", encoding="utf-8") as file:
-                json.dump(rectangle_data, file, indent=4)
+            dump_json(rectangle_data, data_file)
             logger.info("Saved data for rectangle in: %s", filename)
         except Exception as e:
             logger.error("Failed to save rectangle data: %s", e)
@@ -166,12 +194,28 @@ class Rectangle(Circle):
 
 # Example usage of the Rectangle class
 if __name__ == "__main__":
+    from app.logging_config import configure_logging
+
+    configure_logging()
+
     # Initialize a rectangle
     rect1 = Rectangle(
-        x=10, y=20, width=100, height=50, color=[255, 0, 0], frame=1, video_height=1080
+        x=10,
+        y=20,
+        width=100,
+        height=50,
+        color=(255.0, 0.0, 0.0),
+        frame=1,
+        video_height=1080,
     )
     rect2 = Rectangle(
-        x=15, y=25, width=100, height=50, color=[255, 0, 0], frame=2, video_height=1080
+        x=15,
+        y=25,
+        width=100,
+        height=50,
+        color=(255.0, 0.0, 0.0),
+        frame=2,
+        video_height=1080,
     )
 
     # Check if rect2 is the same as rect1
@@ -56,6 +56,24 @@ def test_are_circles_same():
     assert circle1.are_circles_same(circle3, distance_threshold=71) is not False
 
 
+def test_match_batch():
+    prev_xyr = [(100, 200, 50), (400, 400, 20)]
+    new_xyr = [(105, 205, 50), (700, 700, 20), (402, 398, 22)]
+    prev_rgb = [(255.0, 0.0, 0.0), (0.0, 255.0, 0.0)]
+    new_rgb = [(250.0, 5.0, 5.0), (0.0, 255.0, 0.0), (0.0, 0.0, 255.0)]
+
+    matches = Circle.match_batch(prev_xyr, new_xyr, prev_rgb, new_rgb)
+    assert list(matches) == [0, -1, -1], "colors must match as well as position"
+
+    matches = Circle.match_batch(
+        prev_xyr, new_xyr, prev_rgb, new_rgb, color_tolerance=255
+    )
+    assert list(matches) == [0, -1, 1]
+
+    matches = Circle.match_batch([], new_xyr, [], new_rgb)
+    assert list(matches) == [-1, -1, -1]
+
+
 def test_same_circle():
     circle1 = Circle(
         x=100, y=200, radius=50, color=(255.0, 0.0, 0.0), frame=1, video_height=1080
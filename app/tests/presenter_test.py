@@ -39,27 +39,15 @@ def test_update():
     presenter.max_x = 10
     presenter.max_y = 10
 
-    with mock.patch("matplotlib.pyplot.plot") as mock_plot, mock.patch(
-        "matplotlib.pyplot.cla"
-    ), mock.patch("matplotlib.pyplot.xlabel"), mock.patch(
-        "matplotlib.pyplot.ylabel"
-    ), mock.patch(
-        "matplotlib.pyplot.title"
-    ), mock.patch(
-        "matplotlib.pyplot.gca"
-    ), mock.patch(
-        "matplotlib.pyplot.xlim"
-    ), mock.patch(
-        "matplotlib.pyplot.ylim"
-    ), mock.patch(
-        "matplotlib.pyplot.legend"
-    ), mock.patch(
-        "matplotlib.pyplot.grid"
-    ):
-
-        presenter.update(2)
-        assert mock_plot.called
-        assert mock_plot.call_count == 2
+    presenter.lines = [mock.Mock(), mock.Mock()]
+    presenter.title = mock.Mock()
+
+    artists = presenter.update(2)
+
+    for line in presenter.lines:
+        line.set_data.assert_called_once()
+    presenter.title.set_text.assert_called_once()
+    assert artists == presenter.lines + [presenter.title]
 
 
 def test_on_key_press():
@@ -43,7 +43,8 @@ def test_process_circles(tracker, sample_frame):
 
 def test_process_rectangles(tracker, sample_frame):
     frame_grayscale = cv2.cvtColor(sample_frame, cv2.COLOR_BGR2GRAY)
-    tracker.process_rectangles(frame_grayscale, sample_frame, 1)
+    _, thresh = cv2.threshold(frame_grayscale, 10, 255, cv2.THRESH_BINARY)
+    tracker.process_rectangles(thresh, sample_frame, 1)
     assert len(tracker.rectangles) > 0
     assert isinstance(tracker.rectangles[0], Rectangle)
 
@@ -22,38 +22,79 @@ Usage:
 """
 
 import os
+import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
+from scipy.spatial import cKDTree
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from app.circle import Circle
+from app._kernels import match_circle, match_rectangle
+from app.circle import Circle, ensure_data_dir
 from app.rectangle import Rectangle
 from app.logging_config import logger
 
+# Matching thresholds mirror the defaults of Circle.same_circle and
+# Rectangle.same_rectangle.
+CIRCLE_MATCH_RADIUS = 50
+CIRCLE_RADIUS_THRESHOLD = 17
+RECTANGLE_MATCH_RADIUS = 40
+RECTANGLE_SIZE_THRESHOLD = 5
+COLOR_TOLERANCE = 30
+MAX_FRAME_GAP = 20
+
+# Contours smaller than this are noise and never yield a valid square.
+MIN_CONTOUR_AREA = 100
+# A filled square covers its bounding box; circles only reach pi/4 (~0.785).
+MIN_SOLIDITY = 0.9
+
 
 class Tracker:
     """Class to track circles and rectangles in a video."""
 
-    def __init__(self):
-        """Initialize the Tracker with dictionaries for circles and rectangles."""
+    def __init__(self, display: bool = True):
+        """Initialize the Tracker with dictionaries for circles and rectangles.
+
+        Args:
+            display (bool, optional): Whether to show the annotated frames in
+                a window while tracking. Pass False for headless or batch
+                runs: it skips the per-frame imshow copy and the >=1 ms
+                waitKey sleep. Defaults to True.
+        """
+        self.display = display
         self.circles = []
         self.rectangles = []
         self.video_height = 0
         self.video_width = 0
-
-    def delete_dir(self, dir_name="data"):
-        for filename in os.listdir(dir_name):
-            file_path = os.path.join(dir_name, filename)
-            if (
-                os.path.isfile(file_path)
-                and "circle_data_" in filename
-                or "rectangle_data_" in filename
-            ):
-                os.remove(file_path)
+        # Append-mode sinks for retired tracks plus running totals; the
+        # in-memory lists only ever hold the tracks still inside the
+        # matching window (MAX_FRAME_GAP frames).
+        self._circle_sink = None
+        self._rectangle_sink = None
+        self._circle_count = 0
+        self._rectangle_count = 0
+        # Reusable circular masks keyed by radius, for cv2.mean sampling.
+        self._mask_cache = {}
+        # Memoized color prefilters keyed by quantized query color; valid
+        # until the corresponding track pool changes membership.
+        self._circle_color_cache = {}
+        self._rectangle_color_cache = {}
+        # The circle and rectangle passes touch disjoint state and spend
+        # most of their time in GIL-releasing OpenCV calls, so they can
+        # run concurrently on two worker threads.
+        self._pool = ThreadPoolExecutor(max_workers=2)
 
     def delete_dir(self, dir_name="data"):
         """
-        Deletes files containing "circle_data_" or "rectangle_data_" in their names
-        from the specified directory.
+        Deletes stale "circle_data_*" and "rectangle_data_*" files from the
+        specified directory.
 
         Args:
             dir_name (str, optional): The directory path to delete files from. Defaults to "data".
@@ -70,16 +111,21 @@ class Tracker:
             except OSError as e:
                 logger.error("Error creating directory '%s': %s", dir_name, e)
 
-        for filename in os.listdir(dir_name):
-            file_path = os.path.join(dir_name, filename)
-            if os.path.isfile(file_path):
-                if "circle_data_" in filename or "rectangle_data_" in filename:
+        # scandir yields dirent type info without an extra stat per entry.
+        with os.scandir(dir_name) as entries:
+            for entry in entries:
+                if entry.name.startswith(
+                    ("circle_data", "rectangle_data")
+                ) and entry.is_file(follow_symlinks=False):
                     try:
-                        os.remove(file_path)
-                        logger.info("Deleted file: %s/%s", dir_name, filename)
+                        os.remove(entry.path)
+                        logger.info("Deleted file: %s/%s", dir_name, entry.name)
                     except OSError as e:
                         logger.error(
-                            "Failed to delete the file: %s/%s %s", dir_name, filename, e
+                            "Failed to delete the file: %s/%s %s",
+                            dir_name,
+                            entry.name,
+                            e,
                         )
 
     def load_video(self):
@@ -98,6 +144,150 @@ class Tracker:
         self.video_height = int(video.get(cv2.CAP_PROP_FRAME_HEIGHT))
         return video
 
+    @staticmethod
+    def _build_tree(centers):
+        """
+        Builds a KD-tree over track centers.
+
+        Args:
+            centers (np.ndarray): (N, 2) array of centers, one row per tracked object.
+
+        Returns:
+            cKDTree | None: The tree, or None when there are no tracks.
+        """
+        return cKDTree(centers) if len(centers) else None
+
+    @staticmethod
+    def _nearby(tree, cx_arr, cy_arr, x, y, radius):
+        """
+        Returns the indices of tracks within `radius` of (x, y), nearest first.
+
+        Restricting the match scan to this candidate set is semantics
+        preserving: anything farther away than the matching radius would be
+        rejected by the distance threshold anyway.
+
+        Args:
+            tree (cKDTree | None): Tree built by `_build_tree`.
+            cx_arr (np.ndarray): Center x-coordinates the tree was built from.
+            cy_arr (np.ndarray): Center y-coordinates the tree was built from.
+            x (int): Query x-coordinate.
+            y (int): Query y-coordinate.
+            radius (int): Maximum center distance for candidates.
+
+        Returns:
+            np.ndarray: Candidate track indices sorted by distance to the query.
+        """
+        if tree is None:
+            return np.empty(0, dtype=np.int64)
+        candidates = np.asarray(tree.query_ball_point((x, y), r=radius), dtype=np.int64)
+        if candidates.size == 0:
+            return candidates
+        d2 = (cx_arr[candidates] - x) ** 2 + (cy_arr[candidates] - y) ** 2
+        return candidates[np.argsort(d2)]
+
+    @staticmethod
+    def _colors_soa(tracks) -> np.ndarray:
+        """
+        Stacks the tracks' precomputed color arrays into one float32 slab.
+
+        Tracks without a valid color get a NaN row, which the match kernels
+        interpret per-shape (pass for circles, reject for rectangles).
+
+        Args:
+            tracks (list): The tracked objects.
+
+        Returns:
+            np.ndarray: (N, 3) float32 array of RGB colors.
+        """
+        colors = np.full((len(tracks), 3), np.nan, dtype=np.float32)
+        for i, track in enumerate(tracks):
+            if track._color_arr is not None:
+                colors[i] = track._color_arr
+        return colors
+
+    @staticmethod
+    def _spill(sink, track) -> None:
+        """
+        Writes one finished track as a single JSON line.
+
+        Args:
+            sink (file | None): Open text sink, or None when not streaming.
+            track (Circle): The track to write.
+        """
+        if sink is None:
+            return
+        if orjson is not None:
+            sink.write(orjson.dumps(track.to_dict()).decode() + "\n")
+        else:
+            sink.write(json.dumps(track.to_dict()) + "\n")
+
+    def _retire_stale(self, tracks: list, sink, frame_counter: int, cache: dict) -> list:
+        """
+        Retires tracks that fell out of the matching window.
+
+        same_circle/same_rectangle reject anything older than
+        MAX_FRAME_GAP frames, so such tracks can never match again: they
+        are spilled to the sink and dropped from the in-memory list. This
+        keeps the match set O(recently seen objects) instead of O(full
+        history), and memory flat over arbitrarily long videos.
+
+        Args:
+            tracks (list): The currently tracked objects.
+            sink (file | None): Where retired tracks are written.
+            frame_counter (int): The current frame number.
+            cache (dict): Color prefilter cache, invalidated when any track is retired.
+
+        Returns:
+            list: The tracks still eligible for matching.
+        """
+        if frame_counter <= MAX_FRAME_GAP + 1:
+            return tracks
+        kept = []
+        for track in tracks:
+            if frame_counter - track.frame > MAX_FRAME_GAP:
+                self._spill(sink, track)
+            else:
+                kept.append(track)
+        if len(kept) != len(tracks):
+            cache.clear()
+        return kept
+
+    @staticmethod
+    def _color_mask(cache: dict, colors: np.ndarray, color_arr) -> np.ndarray | None:
+        """
+        Returns a per-track mask of color-plausible matches, memoized.
+
+        The query color is quantized to a 512-bucket key (5 bits per
+        channel), so near-identical detections across frames share one
+        cached mask. The mask is a conservative superset — the tolerance
+        is widened by the worst-case quantization error and tracks with
+        unknown (NaN) colors are kept — so the exact per-candidate checks
+        downstream still decide the final answer.
+
+        Args:
+            cache (dict): Bucket-key to mask cache for one track pool.
+            colors (np.ndarray): (N, 3) float32 snapshot of track colors.
+            color_arr (np.ndarray | None): The query's color, or None when unknown.
+
+        Returns:
+            np.ndarray | None: Boolean mask over tracks, or None when the
+            query color is unknown and nothing can be pruned.
+        """
+        if color_arr is None:
+            return None
+        key = (
+            int(color_arr[0]) >> 3,
+            int(color_arr[1]) >> 3,
+            int(color_arr[2]) >> 3,
+        )
+        mask = cache.get(key)
+        if mask is None or mask.size != len(colors):
+            center = np.asarray(key, dtype=np.float32) * 8.0 + 4.0
+            mask = (np.abs(colors - center) <= COLOR_TOLERANCE + 4.0).all(axis=1)
+            mask |= np.isnan(colors[:, 0])
+            cache[key] = mask
+        return mask
+
     def process_circles(self, frame_grayscale, frame, frame_counter: int) -> None:
         """
         Detect circles in a video frame and update the circle's list.
@@ -107,64 +297,159 @@ class Tracker:
             frame (np.ndarray): The RGB frame.
             frame_counter (int): The frame number.
         """
+        # The Hough accumulator cost scales with image area; a 2x pyramid
+        # down with halved radii finds the same circles at a quarter of the
+        # accumulator updates. Coordinates are scaled back up afterwards and
+        # color sampling still reads the full-resolution frame.
+        small = cv2.pyrDown(frame_grayscale)
         circles = cv2.HoughCircles(
-            frame_grayscale,
+            small,
             cv2.HOUGH_GRADIENT,
             dp=1.2,
-            minDist=50,
+            minDist=25,
             param1=50,
             param2=30,
-            minRadius=10,
-            maxRadius=100,
+            minRadius=5,
+            maxRadius=50,
         )
+        # With a UMat input the result is a UMat too; an empty one
+        # retrieves as None, matching the ndarray path's contract.
+        if isinstance(circles, cv2.UMat):
+            circles = circles.get()
         if circles is not None:
-            circles = np.round(circles[0, :]).astype("int")
-            for x, y, r in circles:
-                if (
-                    y - r >= 0
-                    and y + r < frame.shape[0]
-                    and x - r >= 0
-                    and x + r < frame.shape[1]
-                ):
-                    circle_region = frame[y - r : y + r, x - r : x + r]
-                    if circle_region.size > 0:  # Check if region is not empty
-                        average_color = np.mean(circle_region, axis=(0, 1))
-                        average_color = tuple([x for x in average_color[::-1]])
-                        cv2.circle(frame, (x, y), r, (0, 255, 0), 4)
-
-                        new_circle = Circle(
-                            x,
-                            y,
-                            r,
-                            average_color,
-                            frame_counter,
-                            self.video_height,
-                        )
+            circles = np.round(circles[0, :] * 2).astype("int")
+
+            # One vectorized pass rejects out-of-bounds and empty circles
+            # instead of four Python comparisons per detection.
+            height, width = frame.shape[:2]
+            det_xs, det_ys, det_rs = circles[:, 0], circles[:, 1], circles[:, 2]
+            in_bounds = (
+                (det_ys - det_rs >= 0)
+                & (det_ys + det_rs < height)
+                & (det_xs - det_rs >= 0)
+                & (det_xs + det_rs < width)
+                & (det_rs > 0)
+            )
+            detections = []
+
+            for x, y, r in circles[in_bounds].tolist():
+                # cv2.mean with a cached circular mask averages only
+                # the circle's own pixels, not the bounding square's
+                # background corners.
+                mask = self._mask_cache.get(r)
+                if mask is None:
+                    mask = np.zeros((2 * r, 2 * r), dtype=np.uint8)
+                    cv2.circle(mask, (r, r), r, 255, -1)
+                    self._mask_cache[r] = mask
+                region = frame[y - r : y + r, x - r : x + r]
+                average_color = cv2.mean(region, mask=mask)[:3]
+                average_color = tuple(average_color[::-1])
+                if self.display:
+                    cv2.circle(frame, (x, y), r, (0, 255, 0), 4)
+
+                detections.append(
+                    Circle(
+                        x,
+                        y,
+                        r,
+                        average_color,
+                        frame_counter,
+                        self.video_height,
+                    )
+                )
+
+            if not detections:
+                return
+
+            self.circles = self._retire_stale(
+                self.circles, self._circle_sink, frame_counter, self._circle_color_cache
+            )
 
-                        if not any(
-                            circle.same_circle(new_circle, self.video_height)
-                            for circle in self.circles
-                        ):
-                            self.circles.append(new_circle)
-                            logger.info(
-                                "New circle detected: x:%s y:%s rad:%s frame:%s",
-                                new_circle.x,
-                                new_circle.y,
-                                new_circle.radius,
-                                new_circle.frame,
-                            )
-
-    def process_rectangles(self, frame_grayscale, frame, frame_counter: int) -> None:
+            # Per-frame SoA snapshot of the tracked circles: the KD-tree and
+            # the compiled match kernel both read these columns directly.
+            count = len(self.circles)
+            xs = np.fromiter((c.x for c in self.circles), np.int64, count=count)
+            ys = np.fromiter((c.y for c in self.circles), np.int64, count=count)
+            rs = np.fromiter((c.radius for c in self.circles), np.int64, count=count)
+            frames = np.fromiter((c.frame for c in self.circles), np.int64, count=count)
+            colors = self._colors_soa(self.circles)
+            tree = self._build_tree(np.column_stack((xs, ys)))
+
+            for new_circle in detections:
+                matched = False
+                candidates = self._nearby(
+                    tree, xs, ys, new_circle.x, new_circle.y, CIRCLE_MATCH_RADIUS
+                )
+                query_color = new_circle._color_arr
+                color_mask = self._color_mask(
+                    self._circle_color_cache, colors, query_color
+                )
+                if color_mask is not None and candidates.size:
+                    candidates = candidates[color_mask[candidates]]
+                if query_color is None:
+                    cr = cg = cb = np.float32(np.nan)
+                else:
+                    cr, cg, cb = query_color
+
+                while candidates.size:
+                    i = int(
+                        match_circle(
+                            xs,
+                            ys,
+                            rs,
+                            frames,
+                            colors,
+                            candidates,
+                            new_circle.x,
+                            new_circle.y,
+                            new_circle.radius,
+                            new_circle.frame,
+                            cr,
+                            cg,
+                            cb,
+                            CIRCLE_MATCH_RADIUS,
+                            CIRCLE_RADIUS_THRESHOLD,
+                            COLOR_TOLERANCE,
+                            MAX_FRAME_GAP,
+                        )
+                    )
+                    if i < 0:
+                        break
+                    if self.circles[i].same_circle(new_circle, self.video_height):
+                        matched = True
+                        break
+                    # The kernel works on the frame-start snapshot; a track
+                    # already updated this frame re-validates against the live
+                    # object, so drop it and retry the remaining candidates.
+                    candidates = candidates[candidates != i]
+
+                if not matched:
+                    self.circles.append(new_circle)
+                    self._circle_count += 1
+                    self._circle_color_cache.clear()
+                    logger.info(
+                        "New circle detected: x:%s y:%s rad:%s frame:%s",
+                        new_circle.x,
+                        new_circle.y,
+                        new_circle.radius,
+                        new_circle.frame,
+                    )
+
+    def process_rectangles(self, thresh, frame, frame_counter: int) -> None:
         """
         Detect rectangles in a video frame and update the rectangle's list.
 
         Args:
-            frame_grayscale (numpy.ndarray): Grayscale frame.
+            thresh (numpy.ndarray): Binary threshold of the grayscale frame.
             frame (numpy.ndarray): Original frame.
             frame_counter (int): Frame number.
 
         """
-        thresh = cv2.threshold(frame_grayscale, 10, 555, cv2.THRESH_BINARY)[1]
+        # Contours are consumed point-by-point in Python below, so pull the
+        # binary image off the device here; findContours on a UMat would
+        # hand back UMat contours instead.
+        if isinstance(thresh, cv2.UMat):
+            thresh = thresh.get()
 
         contours, _ = cv2.findContours(
             thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
@@ -172,32 +457,103 @@ class Tracker:
 
         rectangles = []
         for contour in contours:
-            approx = cv2.approxPolyDP(
-                contour, 0.01 * cv2.arcLength(contour, True), True
-            )
-            if len(approx) == 4:
-                x, y, w, h = cv2.boundingRect(approx)
-                if w == h:
-                    center_x, center_y = x + w // 2, y + h // 2
-                    color = frame[center_y, center_x]
-                    color = tuple([float(x) for x in color])
-                    rectangles.append((x, y, w, h, color))
+            # A square is a contour whose bounding box is square and nearly
+            # filled by the contour's area: one contourArea and one
+            # boundingRect pass per contour, no iterative Douglas-Peucker
+            # approximation, and no discretization-noise misses when the
+            # polygon fit produces five or more vertices.
+            # Degenerate contours (fewer points than a closed shape needs)
+            # are rejected on length alone, before any geometry calls.
+            if len(contour) < 4:
+                continue
+            area = cv2.contourArea(contour)
+            if area < MIN_CONTOUR_AREA:
+                continue
+            x, y, w, h = cv2.boundingRect(contour)
+            if w != h or area / (w * h) <= MIN_SOLIDITY:
+                continue
+            center_x, center_y = x + w // 2, y + h // 2
+            # astype + tolist converts all three channels to native
+            # Python floats in two C calls instead of a list-comp
+            # with a float() dispatch per channel.
+            color = tuple(frame[center_y, center_x].astype(np.float64).tolist())
+            rectangles.append((x, y, w, h, color))
+
+        self.rectangles = self._retire_stale(
+            self.rectangles,
+            self._rectangle_sink,
+            frame_counter,
+            self._rectangle_color_cache,
+        )
+
+        count = len(self.rectangles)
+        cxs = np.fromiter(
+            (r.x + r.width // 2 for r in self.rectangles), np.int64, count=count
+        )
+        cys = np.fromiter(
+            (r.y + r.height // 2 for r in self.rectangles), np.int64, count=count
+        )
+        ws = np.fromiter((r.width for r in self.rectangles), np.int64, count=count)
+        hs = np.fromiter((r.height for r in self.rectangles), np.int64, count=count)
+        frames = np.fromiter((r.frame for r in self.rectangles), np.int64, count=count)
+        colors = self._colors_soa(self.rectangles)
+        tree = self._build_tree(np.column_stack((cxs, cys)))
 
         for x, y, w, h, color in rectangles:
             new_rectangle = Rectangle(
                 x, y, w, h, color, frame_counter, self.video_height
             )
 
-            if w is not h:
-                continue
-
-            is_new_rectangle = True
-            for rectangle in self.rectangles:
-                if rectangle.same_rectangle(new_rectangle, self.video_height):
-                    is_new_rectangle = False
+            matched = False
+            candidates = self._nearby(
+                tree, cxs, cys, x + w // 2, y + h // 2, RECTANGLE_MATCH_RADIUS
+            )
+            query_color = new_rectangle._color_arr
+            color_mask = self._color_mask(
+                self._rectangle_color_cache, colors, query_color
+            )
+            if color_mask is not None and candidates.size:
+                candidates = candidates[color_mask[candidates]]
+            if query_color is None:
+                cr = cg = cb = np.float32(np.nan)
+            else:
+                cr, cg, cb = query_color
+
+            while candidates.size:
+                i = int(
+                    match_rectangle(
+                        cxs,
+                        cys,
+                        ws,
+                        hs,
+                        frames,
+                        colors,
+                        candidates,
+                        x + w // 2,
+                        y + h // 2,
+                        w,
+                        h,
+                        frame_counter,
+                        cr,
+                        cg,
+                        cb,
+                        RECTANGLE_MATCH_RADIUS,
+                        RECTANGLE_SIZE_THRESHOLD,
+                        COLOR_TOLERANCE,
+                        MAX_FRAME_GAP,
+                    )
+                )
+                if i < 0:
+                    break
+                if self.rectangles[i].same_rectangle(new_rectangle, self.video_height):
+                    matched = True
                     break
-            if is_new_rectangle:
+                candidates = candidates[candidates != i]
+
+            if not matched:
                 self.rectangles.append(new_rectangle)
+                self._rectangle_count += 1
+                self._rectangle_color_cache.clear()
                 logger.info(
                     "New rectangle detected: x:%s y:%s w:%s h:%s frame:%s",
                     new_rectangle.x,
@@ -207,51 +563,119 @@ class Tracker:
                     new_rectangle.frame,
                 )
 
-            cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-            cv2.circle(frame, (x + w // 2, y + h // 2), 2, (255, 0, 0), 3)
+            if self.display:
+                cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
+                cv2.circle(frame, (x + w // 2, y + h // 2), 2, (255, 0, 0), 3)
+
+    @staticmethod
+    def _reader_loop(video, frames_queue, stop) -> None:
+        """
+        Decodes frames into the queue until EOF, an error, or a stop request.
+
+        Runs on a background thread: cv2.VideoCapture.read releases the
+        GIL during decode, so decoding the next frame overlaps with
+        processing the current one. A (False, None) item marks the end of
+        the stream.
+
+        Args:
+            video (cv2.VideoCapture): The opened video.
+            frames_queue (queue.Queue): Bounded hand-off queue for (ret, frame) pairs.
+            stop (threading.Event): Set by the consumer to end decoding early.
+        """
+        while not stop.is_set():
+            try:
+                ret, frame = video.read()
+            except ValueError:
+                frames_queue.put((False, None))
+                return
+            frames_queue.put((ret, frame))
+            if not ret:
+                return
+        frames_queue.put((False, None))
 
     def track(self) -> None:
         """Track circles and rectangles in the video."""
-        frame_counter = 0
         self.delete_dir()
         video = self.load_video()
+        # No-op without an OpenCL device; with one, the UMat pipeline below
+        # runs the per-frame image primitives on the GPU.
+        cv2.ocl.setUseOpenCL(True)
+
+        ensure_data_dir()
+        self._circle_sink = open(os.path.join("data", "circle_data.jsonl"), "w")
+        self._rectangle_sink = open(os.path.join("data", "rectangle_data.jsonl"), "w")
+
+        frames_queue = queue.Queue(maxsize=2)
+        stop_reading = threading.Event()
+        reader = threading.Thread(
+            target=self._reader_loop,
+            args=(video, frames_queue, stop_reading),
+            daemon=True,
+        )
+        reader.start()
 
-        while video.isOpened() and frame_counter < 1000:
-            frame_counter += 1
-            try:
-                ret, frame = video.read()
-            except ValueError:
-                logger.warning("Frame %s could not be read.", frame_counter)
-                break
+        # No isOpened() poll per iteration: a closed video surfaces as
+        # ret=False from the reader, which ends the loop anyway.
+        for frame_counter in range(1, 1001):
+            ret, frame = frames_queue.get()
             if not ret:
                 logger.warning("Frame %s could not be read.", frame_counter)
                 break
-            frame_grayscale = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            # Wrapping the frame in a UMat routes the frame-wide pixel work
+            # (cvtColor, threshold, pyrDown, Hough) through OpenCV's T-API,
+            # which dispatches to OpenCL when a device is available and
+            # falls back to the CPU path otherwise. The BGR ndarray stays
+            # around for color sampling and drawing.
+            uframe = cv2.UMat(frame)
+            frame_grayscale = cv2.cvtColor(uframe, cv2.COLOR_BGR2GRAY)
+            # Threshold once per frame; the rectangle pass only needs the
+            # binary image, the circle pass only the grayscale one.
+            _, thresh = cv2.threshold(frame_grayscale, 10, 255, cv2.THRESH_BINARY)
+
+            circle_future = self._pool.submit(
+                self.process_circles, frame_grayscale, frame, frame_counter
+            )
+            rectangle_future = self._pool.submit(
+                self.process_rectangles, thresh, frame, frame_counter
+            )
+            circle_future.result()
+            rectangle_future.result()
 
-            self.process_circles(frame_grayscale, frame, frame_counter)
-            self.process_rectangles(frame_grayscale, frame, frame_counter)
+            if self.display:
+                cv2.imshow("Frame", frame)
+                if cv2.waitKey(1) & 0xFF == ord("q"):
+                    break
 
-            cv2.imshow("Frame", frame)
-            if cv2.waitKey(1) & 0xFF == ord("q"):
-                break
+        # Unblock the reader if it is waiting on a full queue, then reap it.
+        stop_reading.set()
+        while reader.is_alive():
+            try:
+                frames_queue.get_nowait()
+            except queue.Empty:
+                pass
+            reader.join(timeout=0.1)
 
         video.release()
         cv2.destroyAllWindows()
 
-        x = 0
+        # Flush the tracks still inside the matching window, then close.
         for circle in self.circles:
-            x += 1
-            circle.save_circle(x)
-        x = 0
+            self._spill(self._circle_sink, circle)
         for rectangle in self.rectangles:
-            x += 1
-            rectangle.save_rectangle(x)
-
-        logger.info("Circles detected:%s", len(self.circles))
-        logger.info("Rectangle detected:%s", len(self.rectangles))
+            self._spill(self._rectangle_sink, rectangle)
+        self._circle_sink.close()
+        self._rectangle_sink.close()
+        self._circle_sink = None
+        self._rectangle_sink = None
+
+        logger.info("Circles detected:%s", self._circle_count)
+        logger.info("Rectangle detected:%s", self._rectangle_count)
         logger.info("Tracking completed and data saved.")
 
 
 if __name__ == "__main__":
+    from app.logging_config import configure_logging
+
+    configure_logging()
     tracker = Tracker()
     tracker.track()
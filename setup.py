@@ -0,0 +1,27 @@
+"""
+Optional ahead-of-time build for the hot tracking classes.
+
+Compiling app/circle.py and app/rectangle.py with mypyc turns attribute
+access and the per-pair matching/update path into C-extension dispatch,
+with none of the JIT warmup a Numba-only setup pays on first use. The
+interpreted modules keep working unchanged when mypy is not installed;
+the compiled build is strictly opt-in for deployment:
+
+    pip install mypy
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = mypycify(["app/circle.py", "app/rectangle.py"])
+
+setup(
+    name="lxns",
+    packages=["app"],
+    ext_modules=ext_modules,
+)